@@ -80,17 +80,27 @@ DATABASES = {
     )
 }
 
-# Cache configuration - Use in-memory cache for basic hosting
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'fsm-cache-prod',
-        'TIMEOUT': 300,
-        'OPTIONS': {
-            'MAX_ENTRIES': 1000,
+# Cache configuration - Redis when available so every worker shares one cache,
+# otherwise in-memory cache for basic hosting
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'fsm-cache-prod',
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'MAX_ENTRIES': 1000,
+            }
         }
     }
-}
 
 # Session configuration - Use database sessions for production
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['assigned_technician', 'scheduled_date'], name='job_tech_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['scheduled_date', 'scheduled_start_time'], name='job_date_start_idx'),
+        ),
+    ]
@@ -122,6 +122,11 @@ class Job(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Per-technician day lookups (scheduling conflicts, daily overview)
+            models.Index(fields=['assigned_technician', 'scheduled_date'], name='job_tech_date_idx'),
+            models.Index(fields=['scheduled_date', 'scheduled_start_time'], name='job_date_start_idx'),
+        ]
 
 
 class JobStatusHistory(models.Model):
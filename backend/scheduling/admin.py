@@ -1,7 +1,8 @@
 from django.contrib import admin
+from django.db.models.functions import Now
 from .models import (
     Calendar, TechnicianAvailability, Appointment, ScheduleTemplate,
-    ScheduleConflict, ScheduleOptimization
+    ScheduleConflict, ScheduleOptimization, technician_name_prefetch
 )
 
 
@@ -20,9 +21,10 @@ class TechnicianAvailabilityAdmin(admin.ModelAdmin):
     search_fields = ['technician__user__first_name', 'technician__user__last_name', 'notes']
     date_hierarchy = 'date'
     ordering = ['-date', 'start_time']
+    show_full_result_count = False
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('technician__user')
+        return super().get_queryset(request).prefetch_related(technician_name_prefetch())
 
 
 @admin.register(Appointment)
@@ -32,13 +34,11 @@ class AppointmentAdmin(admin.ModelAdmin):
         'scheduled_start_time', 'customer', 'created_at'
     ]
     list_filter = ['appointment_type', 'status', 'scheduled_date', 'technician']
-    search_fields = [
-        'title', 'description', 'location_address',
-        'technician__user__first_name', 'technician__user__last_name',
-        'customer__first_name', 'customer__last_name'
-    ]
+    # One denormalized column (with the technician's name) so the search is a single indexable LIKE
+    search_fields = ['search_document']
     date_hierarchy = 'scheduled_date'
     ordering = ['-scheduled_date', 'scheduled_start_time']
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -58,7 +58,9 @@ class AppointmentAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('technician__user', 'customer', 'customer_property')
+        return super().get_queryset(request).select_related(
+            'customer', 'customer_property'
+        ).prefetch_related(technician_name_prefetch())
 
 
 @admin.register(ScheduleTemplate)
@@ -103,7 +105,7 @@ class ScheduleTemplateAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('technician__user')
+        return super().get_queryset(request).prefetch_related(technician_name_prefetch())
 
 
 @admin.register(ScheduleConflict)
@@ -120,6 +122,7 @@ class ScheduleConflictAdmin(admin.ModelAdmin):
     ]
     date_hierarchy = 'conflict_date'
     ordering = ['-detected_at']
+    show_full_result_count = False
     readonly_fields = ['detected_at']
     
     fieldsets = (
@@ -140,18 +143,22 @@ class ScheduleConflictAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
-            'job', 'technician__user', 'appointment', 'resolved_by'
-        )
+            'job', 'appointment', 'resolved_by'
+        ).prefetch_related(technician_name_prefetch())
     
+    # Actions must stay set-based: "select all" can cover every conflict in the table.
+    # Use queryset.update() (or ScheduleConflict.bulk_resolve); if per-row logic is ever
+    # needed, walk queryset.values_list('pk', flat=True).iterator(chunk_size=2000) and
+    # update each batch with filter(pk__in=batch) rather than looping over instances.
     actions = ['mark_resolved', 'mark_ignored']
     
     def mark_resolved(self, request, queryset):
-        updated = queryset.update(resolution_status='resolved', resolved_by=request.user)
+        updated = ScheduleConflict.bulk_resolve(queryset, request.user)
         self.message_user(request, f'{updated} conflicts marked as resolved.')
     mark_resolved.short_description = "Mark selected conflicts as resolved"
     
     def mark_ignored(self, request, queryset):
-        updated = queryset.update(resolution_status='ignored', resolved_by=request.user)
+        updated = queryset.update(resolution_status='ignored', resolved_by=request.user, resolved_at=Now())
         self.message_user(request, f'{updated} conflicts marked as ignored.')
     mark_ignored.short_description = "Mark selected conflicts as ignored"
 
@@ -169,6 +176,7 @@ class ScheduleOptimizationAdmin(admin.ModelAdmin):
     ]
     date_hierarchy = 'target_date'
     ordering = ['-optimization_date']
+    show_full_result_count = False
     readonly_fields = ['optimization_date']
     
     fieldsets = (
@@ -188,4 +196,6 @@ class ScheduleOptimizationAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('technician__user', 'created_by')
\ No newline at end of file
+        return super().get_queryset(request).select_related('created_by').prefetch_related(
+            technician_name_prefetch()
+        )
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Versioned response caching for appointment read endpoints
+"""
+
+import time
+from datetime import date
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from fsm_core.cache_utils import CACHE_TIMEOUTS
+
+APPOINTMENT_CACHE_VERSION_KEY = 'scheduling:appointments:version'
+
+# Per-process backends never see another worker's version bump, so their entries must expire quickly
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+PROCESS_LOCAL_TIMEOUT = 5
+
+
+def appointment_cache_version():
+    """Current appointment cache version; seeded from the clock so an evicted counter never reuses old keys"""
+    return cache.get_or_set(APPOINTMENT_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def bump_appointment_cache_version():
+    """Invalidate every cached appointment response at once"""
+    try:
+        cache.incr(APPOINTMENT_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(APPOINTMENT_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def appointment_cache_timeout(timeout):
+    """Cap the timeout when the cache isn't shared between processes"""
+    if isinstance(caches[DEFAULT_CACHE_ALIAS], PROCESS_LOCAL_BACKENDS):
+        return min(timeout, PROCESS_LOCAL_TIMEOUT)
+    return timeout
+
+
+def cached_appointment_data(request, action, build, timeout=CACHE_TIMEOUTS['short']):
+    """
+    Return serialized data for an appointment action, building it only on a cache miss.
+    Keys include today's date and the query string so per-day and per-filter variants stay apart,
+    and the scheme and host because paginated payloads embed absolute next/previous links.
+    """
+    cache_key = ':'.join([
+        'scheduling:appointments',
+        str(appointment_cache_version()),
+        action,
+        date.today().isoformat(),
+        request.scheme,
+        request.get_host(),
+        request.query_params.urlencode(),
+    ])
+    data = cache.get(cache_key)
+    if data is None:
+        data = build()
+        cache.set(cache_key, data, appointment_cache_timeout(timeout))
+    return data
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Sweep-line conflict detection for a technician's day
+"""
+
+import heapq
+from collections import namedtuple
+from itertools import groupby
+from operator import itemgetter
+from django.db.models import CharField, F, Value
+
+from jobs.models import Job
+from .models import TechnicianAvailability, Appointment, ScheduleConflict
+
+ScheduleEvent = namedtuple('ScheduleEvent', ['kind', 'ref_id', 'label', 'start', 'end'])
+
+ITERATOR_CHUNK_SIZE = 2000
+
+EVENT_COLUMNS = ('event_technician', 'event_day', 'kind', 'ref_id', 'label', 'start', 'end')
+
+
+def _event_columns(kind, technician, day, label, start, end):
+    # Same annotation order for every model so the UNION columns line up
+    return {
+        'event_technician': F(technician),
+        'event_day': F(day),
+        'kind': Value(kind, output_field=CharField()),
+        'ref_id': F('id'),
+        'label': F(label),
+        'start': F(start),
+        'end': F(end),
+    }
+
+
+def schedule_events(start_date, end_date, technician_id=None):
+    """
+    Fetch jobs, active appointments and unavailable slots in a date range with one UNION query.
+    Rows come back ordered by technician, day and start time.
+    """
+    jobs = Job.objects.filter(
+        assigned_technician__isnull=False,
+        scheduled_date__range=(start_date, end_date),
+        scheduled_start_time__isnull=False,
+        scheduled_end_time__isnull=False
+    )
+    appointments = Appointment.objects.filter(
+        scheduled_date__range=(start_date, end_date),
+        status__in=Appointment.ACTIVE_STATUSES
+    )
+    availability = TechnicianAvailability.objects.filter(
+        date__range=(start_date, end_date),
+        availability_type__in=TechnicianAvailability.UNAVAILABLE_TYPES
+    )
+    if technician_id is not None:
+        jobs = jobs.filter(assigned_technician_id=technician_id)
+        appointments = appointments.filter(technician_id=technician_id)
+        availability = availability.filter(technician_id=technician_id)
+
+    jobs = jobs.order_by().annotate(**_event_columns(
+        'job', 'assigned_technician_id', 'scheduled_date', 'job_number',
+        'scheduled_start_time', 'scheduled_end_time'
+    )).values_list(*EVENT_COLUMNS)
+    appointments = appointments.order_by().annotate(**_event_columns(
+        'appointment', 'technician_id', 'scheduled_date', 'title',
+        'scheduled_start_time', 'scheduled_end_time'
+    )).values_list(*EVENT_COLUMNS)
+    availability = availability.order_by().annotate(**_event_columns(
+        'availability', 'technician_id', 'date', 'availability_type', 'start_time', 'end_time'
+    )).values_list(*EVENT_COLUMNS)
+
+    return jobs.union(appointments, availability, all=True).order_by('event_technician', 'event_day', 'start')
+
+
+def sweep_overlaps(events):
+    """
+    Yield every pair of overlapping events.
+    Events must be sorted by start; runs in O(N log N + K) for K overlaps.
+    """
+    active = []  # min-heap of (end, index) for events still in progress
+    for index, event in enumerate(events):
+        while active and active[0][0] <= event.start:
+            heapq.heappop(active)
+        for _, active_index in active:
+            yield events[active_index], event
+        heapq.heappush(active, (event.end, index))
+
+
+def _conflict_for(job, other, technician_id, target_date):
+    if other.kind == 'job':
+        conflict_type = 'job_overlap'
+        description = f'Job {job.label} overlaps with job {other.label}'
+    elif other.kind == 'appointment':
+        conflict_type = 'job_overlap'
+        description = f'Job {job.label} overlaps with appointment {other.label}'
+    else:
+        conflict_type = 'availability'
+        description = f'Job {job.label} is scheduled during {other.label} time'
+
+    return ScheduleConflict(
+        conflict_type=conflict_type,
+        description=description,
+        job_id=job.ref_id,
+        technician_id=technician_id,
+        appointment_id=other.ref_id if other.kind == 'appointment' else None,
+        conflict_date=target_date,
+        conflict_start_time=job.start,
+        conflict_end_time=job.end
+    )
+
+
+def detect_range_conflicts(start_date, end_date, technician_id=None):
+    """
+    Build (unsaved) ScheduleConflict records for every technician-day in a range,
+    skipping known conflicts. Runs two queries regardless of the number of jobs.
+    """
+    known = ScheduleConflict.objects.filter(conflict_date__range=(start_date, end_date))
+    if technician_id is not None:
+        known = known.filter(technician_id=technician_id)
+    seen = set(known.values_list('job_id', 'conflict_date', 'conflict_type').iterator(
+        chunk_size=ITERATOR_CHUNK_SIZE
+    ))
+
+    # Stream the range; only one technician-day of events is held in memory at a time
+    rows = schedule_events(start_date, end_date, technician_id=technician_id).iterator(
+        chunk_size=ITERATOR_CHUNK_SIZE
+    )
+    conflicts = []
+    for (day_technician, day), day_rows in groupby(rows, key=itemgetter(0, 1)):
+        events = [ScheduleEvent(*row[2:]) for row in day_rows]
+        for first, second in sweep_overlaps(events):
+            for job, other in ((first, second), (second, first)):
+                if job.kind != 'job':
+                    continue
+                conflict = _conflict_for(job, other, day_technician, day)
+                key = (conflict.job_id, day, conflict.conflict_type)
+                if key not in seen:
+                    seen.add(key)
+                    conflicts.append(conflict)
+    return conflicts
+
+
+def detect_technician_conflicts(technician_id, target_date):
+    """Build (unsaved) ScheduleConflict records for a technician's day, skipping known conflicts"""
+    return detect_range_conflicts(target_date, target_date, technician_id=technician_id)
\ No newline at end of file
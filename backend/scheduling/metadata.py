@@ -0,0 +1,28 @@
+"""
+OPTIONS metadata for scheduling endpoints
+"""
+
+from rest_framework.metadata import SimpleMetadata
+from rest_framework.permissions import AllowAny
+
+
+class CachedSimpleMetadata(SimpleMetadata):
+    """
+    SimpleMetadata memoized per view class and route.
+    Only list routes of views whose permissions are all AllowAny are cached:
+    the 'actions' section otherwise depends on the requesting user, and on
+    detail routes on whether get_object() finds the requested pk.
+    """
+    _cache = {}
+
+    def determine_metadata(self, request, view):
+        lookup_kwarg = getattr(view, 'lookup_url_kwarg', None) or getattr(view, 'lookup_field', None)
+        if lookup_kwarg in view.kwargs:
+            return super().determine_metadata(request, view)
+        if not all(issubclass(permission, AllowAny) for permission in view.permission_classes):
+            return super().determine_metadata(request, view)
+
+        key = (type(view), view.get_view_name(), tuple(view.allowed_methods))
+        if key not in self._cache:
+            self._cache[key] = super().determine_metadata(request, view)
+        return self._cache[key]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+DISPLAY_NAME_MODELS = ['TechnicianAvailability', 'Appointment', 'ScheduleTemplate', 'ScheduleOptimization']
+
+
+def populate_technician_display_name(apps, schema_editor):
+    Technician = apps.get_model('jobs', 'Technician')
+    models_to_update = [apps.get_model('scheduling', name) for name in DISPLAY_NAME_MODELS]
+
+    for technician in Technician.objects.select_related('user'):
+        full_name = f"{technician.user.first_name} {technician.user.last_name}".strip()
+        for model in models_to_update:
+            model.objects.filter(technician=technician).update(technician_display_name=full_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        ('scheduling', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='technician_display_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='scheduleoptimization',
+            name='technician_display_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='scheduletemplate',
+            name='technician_display_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='technicianavailability',
+            name='technician_display_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(populate_technician_display_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0002_technician_display_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status__in', ['scheduled', 'confirmed', 'in_progress'])), fields=['technician', 'scheduled_date'], name='appt_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduleconflict',
+            index=models.Index(condition=models.Q(('resolution_status', 'unresolved')), fields=['technician', 'conflict_date'], name='conf_unresolved_idx'),
+        ),
+    ]
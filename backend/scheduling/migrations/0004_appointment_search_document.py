@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+SEARCH_TRIGRAM_INDEX = 'appt_search_trgm_idx'
+
+
+def populate_search_document(apps, schema_editor):
+    Appointment = apps.get_model('scheduling', 'Appointment')
+
+    batch = []
+    for appointment in Appointment.objects.select_related('customer').iterator(chunk_size=BATCH_SIZE):
+        parts = [appointment.title, appointment.description, appointment.location_address]
+        if appointment.customer_id:
+            parts.append(f"{appointment.customer.first_name} {appointment.customer.last_name}")
+        parts.append(appointment.technician_display_name)
+        appointment.search_document = ' '.join(part for part in parts if part)
+        batch.append(appointment)
+        if len(batch) == BATCH_SIZE:
+            Appointment.objects.bulk_update(batch, ['search_document'])
+            batch = []
+    if batch:
+        Appointment.objects.bulk_update(batch, ['search_document'])
+
+
+def add_search_trigram_index(apps, schema_editor):
+    """
+    PostgreSQL only: a trigram GIN index serving the admin's icontains search, which
+    Django compiles to UPPER(column::text) LIKE UPPER(...)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('scheduling', 'Appointment')._meta.db_table)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {SEARCH_TRIGRAM_INDEX} ON {table} '
+        f'USING gin ((UPPER("search_document"::text)) gin_trgm_ops)'
+    )
+
+
+def remove_search_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_property_latitude_property_longitude'),
+        ('scheduling', '0003_partial_status_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(populate_search_document, migrations.RunPython.noop),
+        migrations.RunPython(add_search_trigram_index, remove_search_trigram_index),
+    ]
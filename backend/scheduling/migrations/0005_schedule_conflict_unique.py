@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-16 10:45
+
+from django.db import migrations, models
+
+
+def remove_duplicate_conflicts(apps, schema_editor):
+    """Keep the earliest conflict for each job/technician/type/date so the constraint can be added"""
+    ScheduleConflict = apps.get_model('scheduling', 'ScheduleConflict')
+    keys = ('job_id', 'technician_id', 'conflict_type', 'conflict_date')
+    duplicates = ScheduleConflict.objects.values(*keys).annotate(
+        first_id=models.Min('id'), rows=models.Count('id')
+    ).filter(rows__gt=1)
+    for duplicate in duplicates:
+        ScheduleConflict.objects.filter(
+            **{key: duplicate[key] for key in keys}
+        ).exclude(id=duplicate['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0004_appointment_search_document'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_conflicts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='scheduleconflict',
+            constraint=models.UniqueConstraint(fields=('job', 'technician', 'conflict_type', 'conflict_date'), name='uniq_conflict'),
+        ),
+    ]
\ No newline at end of file
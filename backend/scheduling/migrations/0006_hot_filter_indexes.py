@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0005_schedule_conflict_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scheduleconflict',
+            index=models.Index(fields=['technician', 'conflict_date', 'resolution_status'], name='conf_tech_date_status_idx'),
+        ),
+    ]
@@ -1,9 +1,85 @@
 from django.db import models
+from django.db.models import Aggregate, CharField, DecimalField, Exists, ExpressionWrapper, IntegerField, OuterRef, Prefetch, Value
+from django.db.models.functions import ExtractHour, ExtractMinute, ExtractSecond, Now, Round
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from jobs.models import Technician, Job
 from customers.models import Customer, Property
-from datetime import datetime, date, time, timedelta
+from datetime import date, time, timedelta
+from functools import cached_property
+
+
+class GroupConcat(Aggregate):
+    """Comma-joined string aggregate; STRING_AGG on PostgreSQL, GROUP_CONCAT on SQLite/MySQL"""
+    function = 'GROUP_CONCAT'
+    template = '%(function)s(%(distinct)s%(expressions)s)'
+    allow_distinct = True
+    output_field = CharField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            function='STRING_AGG',
+            template="%(function)s(%(distinct)s%(expressions)s::text, ',')",
+            **extra_context
+        )
+
+
+def time_seconds(value):
+    """Seconds since midnight for a time, using integer math instead of datetime.combine"""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def time_span(start, end):
+    """timedelta between two same-day times"""
+    return timedelta(
+        seconds=time_seconds(end) - time_seconds(start),
+        microseconds=end.microsecond - start.microsecond
+    )
+
+
+def duration_seconds_expression(start_field, end_field):
+    """Database expression for the whole seconds between two same-day TimeFields"""
+    def seconds(field):
+        return ExtractHour(field) * 3600 + ExtractMinute(field) * 60 + ExtractSecond(field)
+
+    return ExpressionWrapper(seconds(end_field) - seconds(start_field), output_field=IntegerField())
+
+
+def duration_hours_expression(start_field, end_field):
+    """Database expression for the hours between two same-day TimeFields, rounded to 2 places"""
+    return Round(
+        ExpressionWrapper(
+            duration_seconds_expression(start_field, end_field) / Value(3600.0),
+            output_field=DecimalField(max_digits=6, decimal_places=2)
+        ),
+        2
+    )
+
+
+def technician_name_prefetch():
+    """Prefetch technicians with only the user columns needed to display them"""
+    return Prefetch(
+        'technician',
+        queryset=Technician.objects.select_related('user').only(
+            'id', 'employee_id', 'user__id', 'user__first_name', 'user__last_name'
+        )
+    )
+
+
+class TechnicianDisplayNameMixin(models.Model):
+    """Keeps a denormalized copy of the technician's full name for list rendering"""
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.refresh_denormalized_fields()
+        super().save(*args, **kwargs)
+
+    def refresh_denormalized_fields(self):
+        """Recompute cached columns before saving; subclasses extend this"""
+        self.technician_display_name = self.technician.user.get_full_name()
 
 
 class Calendar(models.Model):
@@ -24,7 +100,7 @@ class Calendar(models.Model):
         ordering = ['name']
 
 
-class TechnicianAvailability(models.Model):
+class TechnicianAvailability(TechnicianDisplayNameMixin):
     """Technician availability for specific dates/times"""
     AVAILABILITY_TYPE_CHOICES = [
         ('available', 'Available'),
@@ -35,7 +111,11 @@ class TechnicianAvailability(models.Model):
         ('training', 'Training'),
     ]
 
+    # Types that mean the technician cannot take work
+    UNAVAILABLE_TYPES = ['busy', 'off', 'vacation', 'sick']
+
     technician = models.ForeignKey(Technician, on_delete=models.CASCADE, related_name='availability')
+    technician_display_name = models.CharField(max_length=200, blank=True, editable=False)
     date = models.DateField()
     start_time = models.TimeField()
     end_time = models.TimeField()
@@ -50,14 +130,12 @@ class TechnicianAvailability(models.Model):
         ordering = ['date', 'start_time']
 
     def __str__(self):
-        return f"{self.technician.user.get_full_name()} - {self.date} {self.start_time}-{self.end_time}"
+        return f"{self.technician_display_name} - {self.date} {self.start_time}-{self.end_time}"
 
     @property
     def duration(self):
         """Calculate duration of availability slot"""
-        start_datetime = datetime.combine(self.date, self.start_time)
-        end_datetime = datetime.combine(self.date, self.end_time)
-        return end_datetime - start_datetime
+        return time_span(self.start_time, self.end_time)
 
     def conflicts_with_job(self, job):
         """Check if this availability conflicts with a job"""
@@ -73,7 +151,30 @@ class TechnicianAvailability(models.Model):
         return not (job_end <= self.start_time or job_start >= self.end_time)
 
 
-class Appointment(models.Model):
+class AppointmentManager(models.Manager):
+    """Shared appointment querysets for the API, so every read gets the same projection"""
+
+    # Columns AppointmentSerializer renders, plus the customer's name
+    LIST_FIELDS = (
+        'id', 'title', 'description', 'appointment_type', 'status',
+        'technician', 'technician_display_name', 'scheduled_date', 'scheduled_start_time',
+        'scheduled_end_time', 'location_address', 'location_latitude',
+        'location_longitude', 'customer', 'customer_property', 'created_at', 'updated_at',
+        'customer__id', 'customer__first_name', 'customer__last_name'
+    )
+
+    def default_qs(self):
+        """Appointments with the customer joined and duration_hours annotated"""
+        return self.select_related('customer').annotate(
+            duration_hours=duration_hours_expression('scheduled_start_time', 'scheduled_end_time')
+        )
+
+    def list_qs(self):
+        """default_qs narrowed to the columns list responses render"""
+        return self.default_qs().only(*self.LIST_FIELDS)
+
+
+class Appointment(TechnicianDisplayNameMixin):
     """Scheduled appointments for non-job activities"""
     APPOINTMENT_TYPE_CHOICES = [
         ('meeting', 'Meeting'),
@@ -94,6 +195,8 @@ class Appointment(models.Model):
         ('no_show', 'No Show'),
     ]
 
+    ACTIVE_STATUSES = ['scheduled', 'confirmed', 'in_progress']
+
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     appointment_type = models.CharField(max_length=20, choices=APPOINTMENT_TYPE_CHOICES)
@@ -101,6 +204,7 @@ class Appointment(models.Model):
     
     # Scheduling details
     technician = models.ForeignKey(Technician, on_delete=models.CASCADE, related_name='appointments')
+    technician_display_name = models.CharField(max_length=200, blank=True, editable=False)
     scheduled_date = models.DateField()
     scheduled_start_time = models.TimeField()
     scheduled_end_time = models.TimeField()
@@ -114,26 +218,65 @@ class Appointment(models.Model):
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, null=True, blank=True, related_name='appointments')
     customer_property = models.ForeignKey(Property, on_delete=models.CASCADE, null=True, blank=True, related_name='appointments')
     
+    # Denormalized text for single-table admin search
+    search_document = models.TextField(blank=True, editable=False)
+    
     # Metadata
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='created_appointments')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AppointmentManager()
+
     def __str__(self):
-        return f"{self.title} - {self.technician.user.get_full_name()} ({self.scheduled_date})"
+        return f"{self.title} - {self.technician_display_name} ({self.scheduled_date})"
 
     class Meta:
         ordering = ['scheduled_date', 'scheduled_start_time']
+        indexes = [
+            models.Index(
+                fields=['technician', 'scheduled_date'],
+                name='appt_active_idx',
+                condition=models.Q(status__in=['scheduled', 'confirmed', 'in_progress'])
+            ),
+        ]
+
+    def refresh_denormalized_fields(self):
+        super().refresh_denormalized_fields()
+        self.search_document = self.build_search_document()
+
+    def build_search_document(self):
+        """Combine the searchable text, including the customer's and technician's names"""
+        parts = [self.title, self.description, self.location_address]
+        if self.customer_id:
+            parts.append(self.customer.full_name)
+        parts.append(self.technician_display_name)
+        return ' '.join(part for part in parts if part)
 
     @property
     def duration(self):
         """Calculate appointment duration"""
-        start_datetime = datetime.combine(self.scheduled_date, self.scheduled_start_time)
-        end_datetime = datetime.combine(self.scheduled_date, self.scheduled_end_time)
-        return end_datetime - start_datetime
+        return time_span(self.scheduled_start_time, self.scheduled_end_time)
+
+    @classmethod
+    def bulk_conflicts(cls, job_queryset):
+        """
+        Annotate jobs with has_appointment_conflict using a single overlap subquery.
+        Only active appointments block a slot, which also lets the subquery use appt_active_idx.
+        """
+        overlapping = cls.objects.filter(
+            status__in=cls.ACTIVE_STATUSES,
+            technician=OuterRef('assigned_technician'),
+            scheduled_date=OuterRef('scheduled_date'),
+            scheduled_start_time__lt=OuterRef('scheduled_end_time'),
+            scheduled_end_time__gt=OuterRef('scheduled_start_time')
+        )
+        return job_queryset.annotate(has_appointment_conflict=Exists(overlapping))
 
     def conflicts_with_job(self, job):
-        """Check if this appointment conflicts with a job"""
+        """Check if this appointment conflicts with a job (prefer bulk_conflicts for querysets)"""
+        if self.status not in self.ACTIVE_STATUSES:
+            return False
         if not job.scheduled_date or not job.scheduled_start_time or not job.scheduled_end_time:
             return False
         
@@ -146,11 +289,12 @@ class Appointment(models.Model):
         return not (job_end <= self.scheduled_start_time or job_start >= self.scheduled_end_time)
 
 
-class ScheduleTemplate(models.Model):
+class ScheduleTemplate(TechnicianDisplayNameMixin):
     """Reusable schedule templates for technicians"""
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     technician = models.ForeignKey(Technician, on_delete=models.CASCADE, related_name='schedule_templates')
+    technician_display_name = models.CharField(max_length=200, blank=True, editable=False)
     
     # Weekly schedule
     monday_start = models.TimeField(null=True, blank=True)
@@ -173,26 +317,35 @@ class ScheduleTemplate(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.name} - {self.technician.user.get_full_name()}"
+        return f"{self.name} - {self.technician_display_name}"
 
     class Meta:
         ordering = ['technician', 'name']
 
+    @cached_property
+    def _week_tuple(self):
+        """(start, end) pairs indexed by weekday, built once per instance"""
+        return (
+            (self.monday_start, self.monday_end),
+            (self.tuesday_start, self.tuesday_end),
+            (self.wednesday_start, self.wednesday_end),
+            (self.thursday_start, self.thursday_end),
+            (self.friday_start, self.friday_end),
+            (self.saturday_start, self.saturday_end),
+            (self.sunday_start, self.sunday_end),
+        )
+
     def get_schedule_for_date(self, target_date):
         """Get start/end times for a specific date"""
-        weekday = target_date.weekday()  # 0=Monday, 6=Sunday
-        
-        schedule_map = {
-            0: (self.monday_start, self.monday_end),
-            1: (self.tuesday_start, self.tuesday_end),
-            2: (self.wednesday_start, self.wednesday_end),
-            3: (self.thursday_start, self.thursday_end),
-            4: (self.friday_start, self.friday_end),
-            5: (self.saturday_start, self.saturday_end),
-            6: (self.sunday_start, self.sunday_end),
-        }
-        
-        return schedule_map.get(weekday, (None, None))
+        return self._week_tuple[target_date.weekday()]  # 0=Monday, 6=Sunday
+
+    def save(self, *args, **kwargs):
+        self.__dict__.pop('_week_tuple', None)
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop('_week_tuple', None)
+        super().refresh_from_db(*args, **kwargs)
 
 
 class ScheduleConflict(models.Model):
@@ -238,22 +391,49 @@ class ScheduleConflict(models.Model):
 
     class Meta:
         ordering = ['-detected_at']
+        indexes = [
+            models.Index(
+                fields=['technician', 'conflict_date'],
+                name='conf_unresolved_idx',
+                condition=models.Q(resolution_status='unresolved')
+            ),
+            models.Index(
+                fields=['technician', 'conflict_date', 'resolution_status'],
+                name='conf_tech_date_status_idx'
+            ),
+        ]
+        constraints = [
+            # One row per job/day/type, so detection can lean on bulk_create(ignore_conflicts=True)
+            models.UniqueConstraint(
+                fields=['job', 'technician', 'conflict_type', 'conflict_date'],
+                name='uniq_conflict'
+            ),
+        ]
 
     def mark_resolved(self, user, notes=""):
         """Mark conflict as resolved"""
+        ScheduleConflict.bulk_resolve(ScheduleConflict.objects.filter(pk=self.pk), user, notes)
         self.resolution_status = 'resolved'
-        self.resolved_at = datetime.now()
         self.resolved_by = user
         if notes:
             self.resolution_notes = notes
-        self.save()
+        self.refresh_from_db(fields=['resolved_at'])
+
+    @classmethod
+    def bulk_resolve(cls, queryset, user, notes=""):
+        """Resolve every conflict in the queryset with a single UPDATE"""
+        changes = {'resolution_status': 'resolved', 'resolved_at': Now(), 'resolved_by': user}
+        if notes:
+            changes['resolution_notes'] = notes
+        return queryset.update(**changes)
 
 
-class ScheduleOptimization(models.Model):
+class ScheduleOptimization(TechnicianDisplayNameMixin):
     """Track schedule optimization runs and results"""
     optimization_date = models.DateTimeField(auto_now_add=True)
     target_date = models.DateField()
     technician = models.ForeignKey(Technician, on_delete=models.CASCADE, related_name='optimizations')
+    technician_display_name = models.CharField(max_length=200, blank=True, editable=False)
     
     # Optimization parameters
     optimization_type = models.CharField(max_length=50, choices=[
@@ -275,7 +455,7 @@ class ScheduleOptimization(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
 
     def __str__(self):
-        return f"Optimization {self.optimization_date} - {self.technician.user.get_full_name()}"
+        return f"Optimization {self.optimization_date} - {self.technician_display_name}"
 
     class Meta:
         ordering = ['-optimization_date']
\ No newline at end of file
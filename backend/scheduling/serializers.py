@@ -14,8 +14,8 @@ class CalendarSerializer(serializers.ModelSerializer):
 
 
 class TechnicianAvailabilitySerializer(serializers.ModelSerializer):
-    technician_name = serializers.CharField(source='technician.user.get_full_name', read_only=True)
-    duration_hours = serializers.SerializerMethodField()
+    technician_name = serializers.CharField(source='technician_display_name', read_only=True)
+    duration_hours = serializers.FloatField(read_only=True)  # annotated by the viewset
 
     class Meta:
         model = TechnicianAvailability
@@ -24,11 +24,6 @@ class TechnicianAvailabilitySerializer(serializers.ModelSerializer):
             'availability_type', 'notes', 'duration_hours', 'created_at', 'updated_at'
         ]
 
-    def get_duration_hours(self, obj):
-        """Get duration in hours as a decimal"""
-        duration = obj.duration
-        return round(duration.total_seconds() / 3600, 2)
-
 
 class TechnicianAvailabilityCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -46,9 +41,9 @@ class TechnicianAvailabilityCreateSerializer(serializers.ModelSerializer):
 
 
 class AppointmentSerializer(serializers.ModelSerializer):
-    technician_name = serializers.CharField(source='technician.user.get_full_name', read_only=True)
+    technician_name = serializers.CharField(source='technician_display_name', read_only=True)
     customer_name = serializers.CharField(source='customer.full_name', read_only=True)
-    duration_hours = serializers.SerializerMethodField()
+    duration_hours = serializers.FloatField(read_only=True)  # annotated by the viewset
 
     class Meta:
         model = Appointment
@@ -60,11 +55,6 @@ class AppointmentSerializer(serializers.ModelSerializer):
             'duration_hours', 'created_at', 'updated_at'
         ]
 
-    def get_duration_hours(self, obj):
-        """Get duration in hours as a decimal"""
-        duration = obj.duration
-        return round(duration.total_seconds() / 3600, 2)
-
 
 class AppointmentCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -90,13 +80,14 @@ class AppointmentCreateUpdateSerializer(serializers.ModelSerializer):
         # Get the instance being updated (if any)
         instance = getattr(self, 'instance', None)
         
-        # Check for appointment conflicts
+        # Check for conflicts with active appointments (matches the appt_active_idx partial index)
         conflicting_appointments = Appointment.objects.filter(
             technician=technician,
             scheduled_date=date,
+            status__in=Appointment.ACTIVE_STATUSES,
             scheduled_start_time__lt=end_time,
             scheduled_end_time__gt=start_time
-        )
+        ).only('pk')
         
         if instance:
             conflicting_appointments = conflicting_appointments.exclude(pk=instance.pk)
@@ -108,7 +99,7 @@ class AppointmentCreateUpdateSerializer(serializers.ModelSerializer):
 
 
 class ScheduleTemplateSerializer(serializers.ModelSerializer):
-    technician_name = serializers.CharField(source='technician.user.get_full_name', read_only=True)
+    technician_name = serializers.CharField(source='technician_display_name', read_only=True)
 
     class Meta:
         model = ScheduleTemplate
@@ -121,6 +112,18 @@ class ScheduleTemplateSerializer(serializers.ModelSerializer):
         ]
 
 
+class ScheduleTemplateListSerializer(serializers.ModelSerializer):
+    """Lightweight serializer for template lists (omits the weekly schedule columns)"""
+    technician_name = serializers.CharField(source='technician_display_name', read_only=True)
+
+    class Meta:
+        model = ScheduleTemplate
+        fields = [
+            'id', 'name', 'description', 'technician', 'technician_name',
+            'is_default', 'created_at', 'updated_at'
+        ]
+
+
 class ScheduleConflictSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source='job.title', read_only=True)
     job_number = serializers.CharField(source='job.job_number', read_only=True)
@@ -139,7 +142,7 @@ class ScheduleConflictSerializer(serializers.ModelSerializer):
 
 
 class ScheduleOptimizationSerializer(serializers.ModelSerializer):
-    technician_name = serializers.CharField(source='technician.user.get_full_name', read_only=True)
+    technician_name = serializers.CharField(source='technician_display_name', read_only=True)
     efficiency_rating = serializers.SerializerMethodField()
 
     class Meta:
@@ -167,9 +170,21 @@ class ScheduleOptimizationSerializer(serializers.ModelSerializer):
 
 
 # Specialized serializers for schedule views
+class TechnicianRangeQueryParams(serializers.Serializer):
+    """Query parameters shared by the by_technician actions"""
+    technician_id = serializers.IntegerField()
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+
+class TechnicianOverviewSerializer(TechnicianListSerializer):
+    """Technician summary for daily_overview rows (dicts carrying an annotated full_name)"""
+    full_name = serializers.CharField(read_only=True)
+
+
 class TechnicianScheduleOverviewSerializer(serializers.Serializer):
     """Serializer for technician daily schedule overview"""
-    technician = TechnicianListSerializer(read_only=True)
+    technician = TechnicianOverviewSerializer(read_only=True)
     date = serializers.DateField()
     total_jobs = serializers.IntegerField()
     total_appointments = serializers.IntegerField()
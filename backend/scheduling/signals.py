@@ -0,0 +1,83 @@
+"""
+Signals keeping denormalized and cached scheduling data in sync
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.contrib.auth import get_user_model
+from customers.models import Customer
+from .caching import bump_appointment_cache_version
+from .models import TechnicianAvailability, Appointment, ScheduleTemplate, ScheduleOptimization
+
+User = get_user_model()
+
+# Appointments are handled separately: their search document embeds the name too
+DISPLAY_NAME_MODELS = [TechnicianAvailability, ScheduleTemplate, ScheduleOptimization]
+
+# Columns build_search_document() reads, for loading appointments to rebuild
+SEARCH_DOCUMENT_FIELDS = ['pk', 'title', 'description', 'location_address', 'technician_display_name', 'search_document']
+
+USER_NAME_FIELDS = frozenset({'first_name', 'last_name'})
+
+
+@receiver(post_save, sender=User)
+def sync_technician_display_name(sender, instance, created, update_fields=None, **kwargs):
+    """Refresh cached technician names when a user's name changes"""
+    if created:
+        return
+    # Partial saves that can't touch the name, e.g. update_last_login() on every login
+    if update_fields is not None and not USER_NAME_FIELDS.intersection(update_fields):
+        return
+
+    full_name = instance.get_full_name()
+    updated = 0
+    for model in DISPLAY_NAME_MODELS:
+        updated += model.objects.filter(technician__user=instance).exclude(
+            technician_display_name=full_name
+        ).update(technician_display_name=full_name)
+
+    appointments = list(
+        Appointment.objects.filter(technician__user=instance).exclude(
+            technician_display_name=full_name
+        ).select_related('customer').only(
+            *SEARCH_DOCUMENT_FIELDS, 'customer__first_name', 'customer__last_name'
+        )
+    )
+    for appointment in appointments:
+        appointment.technician_display_name = full_name
+        appointment.search_document = appointment.build_search_document()
+    if appointments:
+        Appointment.objects.bulk_update(
+            appointments, ['technician_display_name', 'search_document'], batch_size=500
+        )
+        bump_appointment_cache_version()
+
+
+CUSTOMER_NAME_FIELDS = frozenset({'first_name', 'last_name'})
+
+
+@receiver(post_save, sender=Customer)
+def sync_appointment_search_document(sender, instance, created, update_fields=None, **kwargs):
+    """Rebuild appointment search text when a customer's name changes"""
+    if created:
+        return
+    if update_fields is not None and not CUSTOMER_NAME_FIELDS.intersection(update_fields):
+        return
+
+    changed = []
+    for appointment in instance.appointments.only(*SEARCH_DOCUMENT_FIELDS, 'customer_id'):
+        appointment.customer = instance
+        search_document = appointment.build_search_document()
+        if search_document != appointment.search_document:
+            appointment.search_document = search_document
+            changed.append(appointment)
+    if changed:
+        Appointment.objects.bulk_update(changed, ['search_document'], batch_size=500)
+        bump_appointment_cache_version()
+
+
+@receiver(post_save, sender=Appointment)
+@receiver(post_delete, sender=Appointment)
+def invalidate_appointment_cache(sender, **kwargs):
+    """Drop cached appointment responses whenever an appointment changes"""
+    bump_appointment_cache_version()
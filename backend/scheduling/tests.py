@@ -1,3 +1,750 @@
-from django.test import TestCase
+"""
+Tests for Scheduling app
+"""
 
-# Create your tests here.
+from datetime import date, time, timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.contrib import admin
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from rest_framework.test import APIRequestFactory
+
+from .models import (
+    TechnicianAvailability, Appointment, ScheduleTemplate, ScheduleConflict, duration_hours_expression
+)
+from .admin import AppointmentAdmin
+from .caching import PROCESS_LOCAL_TIMEOUT, appointment_cache_timeout, appointment_cache_version
+from .serializers import AppointmentCreateUpdateSerializer
+from .views import (
+    AppointmentViewSet, ScheduleConflictViewSet, ScheduleOptimizationViewSet, ScheduleTemplateViewSet,
+    TechnicianAvailabilityViewSet
+)
+from .conflict_sweep import (
+    ScheduleEvent, sweep_overlaps, detect_range_conflicts, detect_technician_conflicts
+)
+from jobs.models import Technician, Job
+from customers.models import Customer, Property
+
+User = get_user_model()
+
+
+class SchedulingTestMixin:
+    """Shared fixtures for scheduling tests"""
+
+    def create_technician(self, username='tech', employee_id='TECH001'):
+        user = User.objects.create_user(
+            username=username,
+            first_name='Sam',
+            last_name='Sparks',
+            role='technician'
+        )
+        return Technician.objects.create(
+            user=user,
+            employee_id=employee_id,
+            phone='+12345678901',
+            hourly_rate=Decimal('45.00')
+        )
+
+    def create_customer_property(self):
+        customer = Customer.objects.create(
+            first_name='John',
+            last_name='Doe',
+            email='john@example.com',
+            phone='+12345678901',
+            street_address='123 Main St',
+            city='Anytown',
+            state='CA',
+            zip_code='90210'
+        )
+        customer_property = Property.objects.create(
+            customer=customer,
+            property_type='single_family',
+            street_address='123 Main St',
+            city='Anytown',
+            state='CA',
+            zip_code='90210'
+        )
+        return customer, customer_property
+
+    def create_job(self, job_number, technician, scheduled_date, start, end):
+        return Job.objects.create(
+            job_number=job_number,
+            customer=self.customer,
+            property=self.property,
+            title='Panel Upgrade',
+            description='Test description',
+            assigned_technician=technician,
+            scheduled_date=scheduled_date,
+            scheduled_start_time=start,
+            scheduled_end_time=end
+        )
+
+
+class DurationAnnotationTest(SchedulingTestMixin, TestCase):
+    """Test database-side duration computation"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+
+    def test_availability_duration_hours(self):
+        """Test availability duration is computed in the query"""
+        TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=date(2025, 6, 2),
+            start_time=time(8, 0),
+            end_time=time(10, 30)
+        )
+
+        availability = TechnicianAvailability.objects.annotate(
+            duration_hours=duration_hours_expression('start_time', 'end_time')
+        ).get()
+
+        self.assertEqual(float(availability.duration_hours), 2.5)
+
+    def test_appointment_duration_hours(self):
+        """Test appointment duration is rounded to two places"""
+        Appointment.objects.create(
+            title='Safety Meeting',
+            appointment_type='meeting',
+            technician=self.technician,
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(9, 20)
+        )
+
+        appointment = Appointment.objects.annotate(
+            duration_hours=duration_hours_expression('scheduled_start_time', 'scheduled_end_time')
+        ).get()
+
+        self.assertEqual(float(appointment.duration_hours), 0.33)
+
+    def test_duration_property(self):
+        """Test the Python duration matches the time span without datetime arithmetic"""
+        availability = TechnicianAvailability(
+            technician=self.technician,
+            date=date(2025, 6, 2),
+            start_time=time(8, 15, 30),
+            end_time=time(10, 0)
+        )
+
+        self.assertEqual(availability.duration, timedelta(hours=1, minutes=44, seconds=30))
+
+
+class AppointmentBulkConflictsTest(SchedulingTestMixin, TestCase):
+    """Test set-based appointment/job overlap detection"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        Appointment.objects.create(
+            title='Training',
+            appointment_type='training',
+            technician=self.technician,
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(11, 0)
+        )
+
+    def test_bulk_conflicts_matches_single_object_check(self):
+        """Test bulk annotation agrees with conflicts_with_job"""
+        self.create_job('J-1', self.technician, date(2025, 6, 2), time(10, 0), time(12, 0))
+        self.create_job('J-2', self.technician, date(2025, 6, 2), time(11, 0), time(13, 0))
+
+        appointment = Appointment.objects.get()
+        jobs = Appointment.bulk_conflicts(Job.objects.all())
+
+        for job in jobs:
+            self.assertEqual(job.has_appointment_conflict, appointment.conflicts_with_job(job))
+        self.assertEqual(
+            {job.job_number for job in jobs if job.has_appointment_conflict},
+            {'J-1'}
+        )
+
+    def test_inactive_appointments_do_not_conflict(self):
+        """Test cancelled appointments no longer block the slot"""
+        self.create_job('J-1', self.technician, date(2025, 6, 2), time(10, 0), time(12, 0))
+        Appointment.objects.update(status='cancelled')
+
+        job = Appointment.bulk_conflicts(Job.objects.all()).get()
+
+        self.assertFalse(job.has_appointment_conflict)
+        self.assertFalse(Appointment.objects.get().conflicts_with_job(job))
+
+
+class TechnicianDisplayNameTest(SchedulingTestMixin, TestCase):
+    """Test the denormalized technician display name"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.availability = TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=date(2025, 6, 2),
+            start_time=time(8, 0),
+            end_time=time(17, 0)
+        )
+
+    def test_display_name_set_on_save(self):
+        """Test display name is copied from the technician's user"""
+        self.assertEqual(self.availability.technician_display_name, 'Sam Sparks')
+        self.assertIn('Sam Sparks', str(self.availability))
+
+    def test_display_name_follows_user_rename(self):
+        """Test renaming the user refreshes cached names"""
+        user = self.technician.user
+        user.last_name = 'Volt'
+        user.save()
+
+        self.availability.refresh_from_db()
+        self.assertEqual(self.availability.technician_display_name, 'Sam Volt')
+
+    def test_login_does_not_touch_scheduling_tables(self):
+        """Test saves limited to non-name fields skip the display name sync"""
+        user = self.technician.user
+
+        with self.assertNumQueries(1):
+            update_last_login(None, user)
+
+
+class ConflictSweepTest(SchedulingTestMixin, TestCase):
+    """Test sweep-line conflict detection"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        self.day = date(2025, 6, 2)
+
+    def test_sweep_overlaps(self):
+        """Test only overlapping pairs are reported"""
+        events = [
+            ScheduleEvent('job', 1, 'A', time(8, 0), time(10, 0)),
+            ScheduleEvent('job', 2, 'B', time(9, 0), time(11, 0)),
+            ScheduleEvent('job', 3, 'C', time(11, 0), time(12, 0)),
+        ]
+
+        pairs = [(a.label, b.label) for a, b in sweep_overlaps(events)]
+
+        self.assertEqual(pairs, [('A', 'B')])
+
+    def test_detect_technician_conflicts(self):
+        """Test job, appointment and availability overlaps become conflicts"""
+        first = self.create_job('J-1', self.technician, self.day, time(8, 0), time(10, 0))
+        second = self.create_job('J-2', self.technician, self.day, time(9, 0), time(11, 0))
+        self.create_job('J-3', self.technician, self.day, time(13, 0), time(14, 0))
+        TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=self.day,
+            start_time=time(13, 30),
+            end_time=time(17, 0),
+            availability_type='off'
+        )
+
+        conflicts = detect_technician_conflicts(self.technician.id, self.day)
+
+        self.assertEqual(
+            sorted((c.job_id, c.conflict_type) for c in conflicts),
+            sorted([
+                (first.id, 'job_overlap'),
+                (second.id, 'job_overlap'),
+                (Job.objects.get(job_number='J-3').id, 'availability'),
+            ])
+        )
+
+    def test_inactive_appointments_do_not_conflict(self):
+        """Test cancelled, completed and no-show appointments no longer block the slot"""
+        self.create_job('J-1', self.technician, self.day, time(9, 0), time(11, 0))
+        for status in ('cancelled', 'completed', 'no_show'):
+            Appointment.objects.create(
+                title=f'Meeting ({status})',
+                appointment_type='meeting',
+                technician=self.technician,
+                scheduled_date=self.day,
+                scheduled_start_time=time(10, 0),
+                scheduled_end_time=time(12, 0),
+                status=status
+            )
+
+        self.assertEqual(detect_technician_conflicts(self.technician.id, self.day), [])
+
+    def test_existing_conflicts_are_skipped(self):
+        """Test previously recorded conflicts are not duplicated"""
+        self.create_job('J-1', self.technician, self.day, time(8, 0), time(10, 0))
+        self.create_job('J-2', self.technician, self.day, time(9, 0), time(11, 0))
+
+        ScheduleConflict.objects.bulk_create(detect_technician_conflicts(self.technician.id, self.day))
+
+        self.assertEqual(detect_technician_conflicts(self.technician.id, self.day), [])
+        self.assertEqual(ScheduleConflict.objects.count(), 2)
+
+    def test_database_rejects_duplicate_conflicts(self):
+        """Test racing detections cannot store the same conflict twice"""
+        self.create_job('J-1', self.technician, self.day, time(8, 0), time(10, 0))
+        self.create_job('J-2', self.technician, self.day, time(9, 0), time(11, 0))
+        first_pass = detect_technician_conflicts(self.technician.id, self.day)
+        second_pass = detect_technician_conflicts(self.technician.id, self.day)
+
+        ScheduleConflict.objects.bulk_create(first_pass, ignore_conflicts=True)
+        ScheduleConflict.objects.bulk_create(second_pass, ignore_conflicts=True)
+
+        self.assertEqual(ScheduleConflict.objects.count(), 2)
+
+    def test_detect_range_conflicts(self):
+        """Test a whole range is swept per technician-day in constant queries"""
+        other = self.create_technician(username='tech2', employee_id='TECH002')
+        next_day = date(2025, 6, 3)
+        self.create_job('J-1', self.technician, self.day, time(8, 0), time(10, 0))
+        self.create_job('J-2', self.technician, self.day, time(9, 0), time(11, 0))
+        self.create_job('J-3', self.technician, next_day, time(9, 0), time(11, 0))
+        self.create_job('J-4', other, self.day, time(9, 0), time(11, 0))
+        self.create_job('J-5', other, next_day, time(8, 0), time(12, 0))
+        self.create_job('J-6', other, next_day, time(10, 0), time(11, 0))
+
+        with self.assertNumQueries(2):
+            conflicts = detect_range_conflicts(self.day, next_day)
+
+        self.assertEqual(
+            sorted(Job.objects.get(pk=c.job_id).job_number for c in conflicts),
+            ['J-1', 'J-2', 'J-5', 'J-6']
+        )
+
+
+class ScheduleConflictResolutionTest(SchedulingTestMixin, TestCase):
+    """Test conflict resolution helpers"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        self.manager = User.objects.create_user(username='manager', role='manager')
+        job = self.create_job('J-1', self.technician, date(2025, 6, 2), time(8, 0), time(10, 0))
+        self.conflict = ScheduleConflict.objects.create(
+            conflict_type='job_overlap',
+            description='Overlap',
+            job=job,
+            technician=self.technician,
+            conflict_date=date(2025, 6, 2),
+            conflict_start_time=time(8, 0),
+            conflict_end_time=time(10, 0)
+        )
+
+    def test_mark_resolved(self):
+        """Test mark_resolved stamps the resolution in the database"""
+        self.conflict.mark_resolved(self.manager, notes='Rescheduled')
+
+        self.assertIsNotNone(self.conflict.resolved_at)
+        stored = ScheduleConflict.objects.get(pk=self.conflict.pk)
+        self.assertEqual(stored.resolution_status, 'resolved')
+        self.assertEqual(stored.resolved_by, self.manager)
+        self.assertEqual(stored.resolution_notes, 'Rescheduled')
+        self.assertEqual(stored.resolved_at, self.conflict.resolved_at)
+
+    def test_bulk_resolve_keeps_notes_when_blank(self):
+        """Test bulk_resolve leaves existing notes untouched without new notes"""
+        ScheduleConflict.objects.filter(pk=self.conflict.pk).update(resolution_notes='Original')
+
+        updated = ScheduleConflict.bulk_resolve(ScheduleConflict.objects.all(), self.manager)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(ScheduleConflict.objects.get().resolution_notes, 'Original')
+
+
+class AppointmentSearchDocumentTest(SchedulingTestMixin, TestCase):
+    """Test the denormalized appointment search text"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        self.appointment = Appointment.objects.create(
+            title='Site Survey',
+            appointment_type='meeting',
+            technician=self.technician,
+            customer=self.customer,
+            location_address='42 Elm St',
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(10, 0)
+        )
+
+    def test_search_document_built_on_save(self):
+        """Test appointment text and customer name are searchable"""
+        self.assertEqual(self.appointment.search_document, 'Site Survey 42 Elm St John Doe Sam Sparks')
+
+    def test_search_document_follows_customer_rename(self):
+        """Test renaming the customer refreshes appointment search text"""
+        self.customer.last_name = 'Roe'
+        self.customer.save()
+
+        self.appointment.refresh_from_db()
+        self.assertIn('John Roe', self.appointment.search_document)
+
+    def test_customer_save_without_rename_writes_nothing(self):
+        """Test non-name customer edits leave appointments and the response cache alone"""
+        self.customer.phone = '+12345678902'
+        version = appointment_cache_version()
+
+        with self.assertNumQueries(1):
+            self.customer.save(update_fields=['phone'])
+        with self.assertNumQueries(2):
+            self.customer.save()
+        self.assertEqual(appointment_cache_version(), version)
+
+    def test_search_document_follows_technician_rename(self):
+        """Test renaming the technician's user refreshes appointment search text"""
+        user = self.technician.user
+        user.last_name = 'Volt'
+        user.save()
+
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.technician_display_name, 'Sam Volt')
+        self.assertTrue(self.appointment.search_document.endswith('Sam Volt'))
+
+    def test_admin_search_matches_technician_name(self):
+        """Test the admin finds appointments by technician name through the search document"""
+        model_admin = AppointmentAdmin(Appointment, admin.site)
+
+        results, _ = model_admin.get_search_results(None, Appointment.objects.all(), 'Sparks')
+
+        self.assertEqual(list(results), [self.appointment])
+
+
+class ScheduleTemplateTest(SchedulingTestMixin, TestCase):
+    """Test ScheduleTemplate weekday lookup"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.template = ScheduleTemplate.objects.create(
+            name='Standard Week',
+            technician=self.technician,
+            monday_start=time(8, 0),
+            monday_end=time(17, 0),
+            saturday_start=time(9, 0),
+            saturday_end=time(12, 0)
+        )
+
+    def test_get_schedule_for_date(self):
+        """Test each weekday maps to its own columns"""
+        self.assertEqual(self.template.get_schedule_for_date(date(2025, 6, 2)), (time(8, 0), time(17, 0)))
+        self.assertEqual(self.template.get_schedule_for_date(date(2025, 6, 7)), (time(9, 0), time(12, 0)))
+        self.assertEqual(self.template.get_schedule_for_date(date(2025, 6, 8)), (None, None))
+
+    def test_schedule_refreshed_after_save(self):
+        """Test the cached weekday tuple is dropped when the template is saved"""
+        self.template.get_schedule_for_date(date(2025, 6, 2))
+        self.template.monday_end = time(15, 0)
+        self.template.save()
+
+        self.assertEqual(self.template.get_schedule_for_date(date(2025, 6, 2)), (time(8, 0), time(15, 0)))
+
+    def test_apply_to_date_range(self):
+        """Test only missing working days are created, with the technician name filled in"""
+        TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=date(2025, 6, 2),
+            start_time=time(8, 0),
+            end_time=time(17, 0)
+        )
+        view = ScheduleTemplateViewSet.as_view({'post': 'apply_to_date_range'})
+        request = APIRequestFactory().post(
+            '/', {'start_date': '2025-06-02', 'end_date': '2025-06-15'}, format='json'
+        )
+
+        response = view(request, pk=self.template.pk)
+
+        self.assertEqual(response.data['created_availability'], 3)
+        created = TechnicianAvailability.objects.exclude(date=date(2025, 6, 2))
+        self.assertEqual(
+            sorted(created.values_list('date', flat=True)),
+            [date(2025, 6, 7), date(2025, 6, 9), date(2025, 6, 14)]
+        )
+        self.assertTrue(all(a.technician_display_name == 'Sam Sparks' for a in created))
+
+
+class AppointmentValidationTest(SchedulingTestMixin, TestCase):
+    """Test appointment conflict validation"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.existing = Appointment.objects.create(
+            title='Training',
+            appointment_type='training',
+            technician=self.technician,
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(11, 0)
+        )
+
+    def get_serializer(self):
+        return AppointmentCreateUpdateSerializer(data={
+            'title': 'Meeting',
+            'appointment_type': 'meeting',
+            'technician': self.technician.id,
+            'scheduled_date': '2025-06-02',
+            'scheduled_start_time': '10:00',
+            'scheduled_end_time': '12:00'
+        })
+
+    def test_overlapping_active_appointment_rejected(self):
+        """Test overlaps with active appointments are rejected"""
+        self.assertFalse(self.get_serializer().is_valid())
+
+    def test_cancelled_appointment_does_not_block(self):
+        """Test cancelled appointments free their time slot"""
+        self.existing.status = 'cancelled'
+        self.existing.save()
+
+        self.assertTrue(self.get_serializer().is_valid())
+
+
+class CachedSimpleMetadataTest(SchedulingTestMixin, TestCase):
+    """Test memoized OPTIONS metadata"""
+
+    def test_metadata_reused_across_requests(self):
+        """Test repeated OPTIONS requests reuse the computed metadata"""
+        factory = APIRequestFactory()
+        view = AppointmentViewSet.as_view({'get': 'list', 'post': 'create'})
+
+        first = view(factory.options('/api/scheduling/appointments/'))
+        second = view(factory.options('/api/scheduling/appointments/'))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('POST', first.data['actions'])
+        self.assertIs(first.data, second.data)
+
+    def test_detail_metadata_not_shared_across_pks(self):
+        """Test a missing pk does not hide PUT from later detail OPTIONS requests"""
+        technician = self.create_technician()
+        appointment = Appointment.objects.create(
+            title='Training',
+            appointment_type='training',
+            technician=technician,
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(10, 0)
+        )
+        factory = APIRequestFactory()
+        view = AppointmentViewSet.as_view({'get': 'retrieve', 'put': 'update'})
+
+        missing = view(factory.options('/api/scheduling/appointments/0/'), pk=0)
+        found = view(factory.options(f'/api/scheduling/appointments/{appointment.pk}/'), pk=appointment.pk)
+
+        self.assertNotIn('actions', missing.data)
+        self.assertIn('PUT', found.data['actions'])
+
+
+class AvailabilityConflictsViewTest(SchedulingTestMixin, TestCase):
+    """Test the availability conflicts endpoint"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        self.day = date(2025, 6, 2)
+        self.view = TechnicianAvailabilityViewSet.as_view({'get': 'conflicts'})
+
+    def test_conflicting_jobs_grouped_per_availability(self):
+        """Test overlapping jobs are listed under the blocking availability"""
+        self.create_job('J-1', self.technician, self.day, time(9, 0), time(10, 0))
+        self.create_job('J-2', self.technician, self.day, time(11, 0), time(12, 0))
+        self.create_job('J-3', self.technician, self.day, time(15, 0), time(16, 0))
+        off = TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=self.day,
+            start_time=time(8, 0),
+            end_time=time(13, 0),
+            availability_type='off'
+        )
+        TechnicianAvailability.objects.create(
+            technician=self.technician,
+            date=self.day,
+            start_time=time(14, 0),
+            end_time=time(17, 0),
+            availability_type='available'
+        )
+
+        with self.assertNumQueries(2):  # page count + grouped page
+            response = self.view(APIRequestFactory().get('/api/scheduling/availability/conflicts/'))
+
+        self.assertEqual(response.data['count'], 1)
+        result = response.data['results'][0]
+        self.assertEqual(result['availability']['id'], off.id)
+        self.assertEqual(sorted(result['conflicting_jobs']), ['J-1', 'J-2'])
+
+
+class DailyOverviewTest(SchedulingTestMixin, TestCase):
+    """Test the daily schedule overview"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+        self.day = date(2025, 6, 2)
+        self.view = ScheduleOptimizationViewSet.as_view({'get': 'daily_overview'})
+
+    def test_work_hours_summed_in_database(self):
+        """Test job and appointment durations are totalled per technician"""
+        self.create_job('J-1', self.technician, self.day, time(8, 0), time(10, 30))
+        self.create_job('J-2', self.technician, self.day, time(13, 0), time(14, 0))
+        Appointment.objects.create(
+            title='Site Survey',
+            appointment_type='meeting',
+            technician=self.technician,
+            scheduled_date=self.day,
+            scheduled_start_time=time(15, 0),
+            scheduled_end_time=time(15, 30)
+        )
+
+        with self.assertNumQueries(2):
+            response = self.view(APIRequestFactory().get('/', {'date': '2025-06-02'}))
+
+        row = response.data['technicians'][0]
+        self.assertEqual(row['total_jobs'], 2)
+        self.assertEqual(row['total_appointments'], 1)
+        self.assertEqual(row['total_work_hours'], '4.00')
+        self.assertEqual(row['technician']['full_name'], 'Sam Sparks')
+        self.assertEqual(response.data['total_jobs'], 2)
+
+    def test_average_utilization_across_technicians(self):
+        """Test the average utilization is computed alongside the technician rows"""
+        other = self.create_technician(username='tech2', employee_id='TECH002')
+        self.create_job('J-1', self.technician, self.day, time(8, 0), time(16, 0))
+        self.create_job('J-2', other, self.day, time(8, 0), time(12, 0))
+
+        with self.assertNumQueries(2):
+            response = self.view(APIRequestFactory().get('/', {'date': '2025-06-02'}))
+
+        self.assertEqual(response.data['average_utilization'], '75.00')
+
+
+class AppointmentResponseCacheTest(SchedulingTestMixin, TestCase):
+    """Test cached today/upcoming appointment responses"""
+
+    def setUp(self):
+        cache.clear()
+        self.technician = self.create_technician()
+        self.view = AppointmentViewSet.as_view({'get': 'today'})
+
+    def create_appointment(self, title):
+        return Appointment.objects.create(
+            title=title,
+            appointment_type='meeting',
+            technician=self.technician,
+            scheduled_date=date.today(),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(10, 0)
+        )
+
+    def get_titles(self, host='testserver'):
+        response = self.view(APIRequestFactory().get('/api/scheduling/appointments/today/', HTTP_HOST=host))
+        return [appointment['title'] for appointment in response.data['results']]
+
+    def test_repeat_requests_served_from_cache(self):
+        """Test the second request does not touch the database"""
+        self.create_appointment('Site Survey')
+        self.get_titles()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_titles(), ['Site Survey'])
+
+    def test_appointment_changes_invalidate_cache(self):
+        """Test saving or deleting an appointment refreshes the cached list"""
+        appointment = self.create_appointment('Site Survey')
+        self.assertEqual(self.get_titles(), ['Site Survey'])
+
+        self.create_appointment('Follow Up')
+        self.assertEqual(sorted(self.get_titles()), ['Follow Up', 'Site Survey'])
+
+        appointment.delete()
+        self.assertEqual(self.get_titles(), ['Follow Up'])
+
+    @override_settings(ALLOWED_HOSTS=['a.example', 'b.example'])
+    def test_cache_keyed_by_host(self):
+        """Test payloads with absolute pagination links are not shared across hosts"""
+        self.create_appointment('Site Survey')
+        self.get_titles(host='a.example')
+        # A queryset update skips the invalidation signals, so only a cache miss can see it
+        Appointment.objects.update(title='Renamed')
+
+        self.assertEqual(self.get_titles(host='a.example'), ['Site Survey'])
+        self.assertEqual(self.get_titles(host='b.example'), ['Renamed'])
+
+    def test_process_local_cache_expires_quickly(self):
+        """Test per-process caches hold entries only briefly since other workers can't invalidate them"""
+        self.assertEqual(appointment_cache_timeout(300), PROCESS_LOCAL_TIMEOUT)
+
+
+class ListColumnsTest(SchedulingTestMixin, TestCase):
+    """Test list endpoints load only rendered columns without extra queries"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.customer, self.property = self.create_customer_property()
+
+    def test_appointment_list_renders_customer_name_without_extra_queries(self):
+        """Test deferred columns are never touched while serializing"""
+        Appointment.objects.create(
+            title='Site Survey',
+            appointment_type='meeting',
+            technician=self.technician,
+            customer=self.customer,
+            scheduled_date=date(2025, 6, 2),
+            scheduled_start_time=time(9, 0),
+            scheduled_end_time=time(10, 0)
+        )
+        view = AppointmentViewSet.as_view({'get': 'by_technician'})
+
+        with self.assertNumQueries(2):  # page count + page
+            response = view(APIRequestFactory().get('/', {'technician_id': self.technician.id}))
+
+        self.assertEqual(response.data['results'][0]['customer_name'], self.customer.full_name)
+
+    def test_conflict_list_renders_job_fields(self):
+        """Test job columns come from the narrowed join"""
+        job = self.create_job('J-1', self.technician, date(2025, 6, 2), time(8, 0), time(10, 0))
+        ScheduleConflict.objects.create(
+            conflict_type='job_overlap',
+            description='Overlap',
+            job=job,
+            technician=self.technician,
+            conflict_date=date(2025, 6, 2),
+            conflict_start_time=time(8, 0),
+            conflict_end_time=time(10, 0)
+        )
+        view = ScheduleConflictViewSet.as_view({'get': 'unresolved'})
+
+        with self.assertNumQueries(3):  # page count + page + technician prefetch
+            response = view(APIRequestFactory().get('/'))
+
+        self.assertEqual(response.data['results'][0]['job_number'], 'J-1')
+        self.assertEqual(response.data['results'][0]['technician_name'], 'Sam Sparks')
+
+
+class TechnicianRangeQueryParamsTest(SchedulingTestMixin, TestCase):
+    """Test by_technician query parameter validation"""
+
+    def setUp(self):
+        self.technician = self.create_technician()
+        self.view = TechnicianAvailabilityViewSet.as_view({'get': 'by_technician'})
+        for day in (1, 2, 3):
+            TechnicianAvailability.objects.create(
+                technician=self.technician,
+                date=date(2025, 6, day),
+                start_time=time(8, 0),
+                end_time=time(17, 0)
+            )
+
+    def test_bad_parameters_rejected_before_querying(self):
+        """Test non-integer ids and malformed dates fail validation without a query"""
+        with self.assertNumQueries(0):
+            response = self.view(APIRequestFactory().get('/', {'technician_id': 'abc', 'date_from': '06/01/2025'}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('technician_id', response.data)
+        self.assertIn('date_from', response.data)
+
+    def test_date_range_applied(self):
+        """Test date_from and date_to bound the results"""
+        response = self.view(APIRequestFactory().get('/', {
+            'technician_id': self.technician.id,
+            'date_from': '2025-06-02',
+            'date_to': '2025-06-03',
+        }))
+
+        self.assertEqual([row['date'] for row in response.data['results']], ['2025-06-02', '2025-06-03'])
@@ -3,27 +3,80 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count, Sum, Avg
-from datetime import datetime, date, timedelta
+from django.db.models import Q, F, Count, Sum, Avg, FloatField, OuterRef, Subquery, Value, Window
+from django.db.models.functions import Coalesce, Concat, Trim
+from datetime import date, timedelta
 from django.utils import timezone
 
 from .models import (
     Calendar, TechnicianAvailability, Appointment, ScheduleTemplate,
-    ScheduleConflict, ScheduleOptimization
+    ScheduleConflict, ScheduleOptimization, GroupConcat, duration_hours_expression,
+    duration_seconds_expression, technician_name_prefetch
 )
 from .serializers import (
     CalendarSerializer, TechnicianAvailabilitySerializer, TechnicianAvailabilityCreateSerializer,
     AppointmentSerializer, AppointmentCreateUpdateSerializer, ScheduleTemplateSerializer,
+    ScheduleTemplateListSerializer,
     ScheduleConflictSerializer, ScheduleOptimizationSerializer,
-    TechnicianScheduleOverviewSerializer, DailyScheduleSerializer
+    TechnicianScheduleOverviewSerializer, DailyScheduleSerializer, TechnicianRangeQueryParams
 )
+from .caching import cached_appointment_data
+from .conflict_sweep import detect_range_conflicts
+from .metadata import CachedSimpleMetadata
 from jobs.models import Technician, Job
 
 
+def _aggregate_subquery(queryset, technician_field, aggregate):
+    """Correlated aggregate of queryset rows for the outer technician, 0 when there are none"""
+    totals = queryset.filter(**{technician_field: OuterRef('pk')}).order_by().values(
+        technician_field
+    ).annotate(total=aggregate).values('total')
+    return Coalesce(Subquery(totals), 0)
+
+
+def _count_subquery(queryset, technician_field):
+    """Correlated COUNT of queryset rows for the outer technician"""
+    return _aggregate_subquery(queryset, technician_field, Count('pk'))
+
+
+def _seconds_subquery(queryset, technician_field, start_field, end_field):
+    """Correlated SUM of scheduled seconds for the outer technician"""
+    return _aggregate_subquery(
+        queryset, technician_field, Sum(duration_seconds_expression(start_field, end_field))
+    )
+
+
+# Technician columns rendered by TechnicianOverviewSerializer in daily_overview
+OVERVIEW_TECHNICIAN_FIELDS = (
+    'id', 'employee_id', 'full_name', 'skill_level', 'is_available', 'emergency_availability'
+)
+
+
+def _filter_technician_range(queryset, params, date_field):
+    """Apply validated TechnicianRangeQueryParams to a queryset"""
+    queryset = queryset.filter(technician_id=params['technician_id'])
+    if 'date_from' in params:
+        queryset = queryset.filter(**{f'{date_field}__gte': params['date_from']})
+    if 'date_to' in params:
+        queryset = queryset.filter(**{f'{date_field}__lte': params['date_to']})
+    return queryset
+
+
+class PaginatedActionMixin:
+    """Page custom list actions with the viewset's paginator, like the default list view"""
+
+    def paginated_data(self, queryset, serialize=None):
+        page = self.paginate_queryset(queryset)
+        items = queryset if page is None else page
+        data = serialize(items) if serialize else self.get_serializer(items, many=True).data
+        return data if page is None else self.get_paginated_response(data).data
+
+
 class CalendarViewSet(viewsets.ModelViewSet):
     queryset = Calendar.objects.all()
     serializer_class = CalendarSerializer
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active']
     search_fields = ['name', 'description']
@@ -31,9 +84,12 @@ class CalendarViewSet(viewsets.ModelViewSet):
     ordering = ['name']
 
 
-class TechnicianAvailabilityViewSet(viewsets.ModelViewSet):
-    queryset = TechnicianAvailability.objects.select_related('technician__user', 'created_by')
+class TechnicianAvailabilityViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
+    queryset = TechnicianAvailability.objects.annotate(
+        duration_hours=duration_hours_expression('start_time', 'end_time')
+    )
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['technician', 'date', 'availability_type']
     ordering_fields = ['date', 'start_time']
@@ -47,69 +103,55 @@ class TechnicianAvailabilityViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def by_technician(self, request):
         """Get availability by technician for a date range"""
-        technician_id = request.query_params.get('technician_id')
-        date_from = request.query_params.get('date_from')
-        date_to = request.query_params.get('date_to')
-
-        if not technician_id:
-            return Response({'error': 'technician_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        params = TechnicianRangeQueryParams(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = _filter_technician_range(self.queryset, params.validated_data, 'date')
 
-        queryset = self.queryset.filter(technician_id=technician_id)
-
-        if date_from:
-            try:
-                date_from = datetime.strptime(date_from, '%Y-%m-%d').date()
-                queryset = queryset.filter(date__gte=date_from)
-            except ValueError:
-                return Response({'error': 'Invalid date_from format. Use YYYY-MM-DD'}, 
-                              status=status.HTTP_400_BAD_REQUEST)
-
-        if date_to:
-            try:
-                date_to = datetime.strptime(date_to, '%Y-%m-%d').date()
-                queryset = queryset.filter(date__lte=date_to)
-            except ValueError:
-                return Response({'error': 'Invalid date_to format. Use YYYY-MM-DD'}, 
-                              status=status.HTTP_400_BAD_REQUEST)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(self.paginated_data(queryset))
 
     @action(detail=False, methods=['get'])
     def conflicts(self, request):
         """Get availability that conflicts with scheduled jobs"""
-        conflicts = []
-        availabilities = self.queryset.filter(availability_type__in=['busy', 'off', 'vacation', 'sick'])
+        availabilities = self.queryset.filter(availability_type__in=TechnicianAvailability.UNAVAILABLE_TYPES)
         
-        for availability in availabilities:
-            # Check for job conflicts
-            conflicting_jobs = Job.objects.filter(
-                assigned_technician=availability.technician,
-                scheduled_date=availability.date,
-                scheduled_start_time__lt=availability.end_time,
-                scheduled_end_time__gt=availability.start_time
-            )
-            
-            if conflicting_jobs.exists():
-                conflicts.append({
+        # One grouped query: each blocking slot with its overlapping job numbers joined in SQL
+        overlapping = availabilities.filter(
+            technician__assigned_jobs__scheduled_date=F('date'),
+            technician__assigned_jobs__scheduled_start_time__lt=F('end_time'),
+            technician__assigned_jobs__scheduled_end_time__gt=F('start_time')
+        ).annotate(
+            conflicting_job_numbers=GroupConcat('technician__assigned_jobs__job_number')
+        ).order_by('date', 'start_time', 'pk')  # grouping drops Meta.ordering; pages need a stable order
+        
+        def serialize(page):
+            return [
+                {
                     'availability': TechnicianAvailabilitySerializer(availability).data,
-                    'conflicting_jobs': [job.job_number for job in conflicting_jobs]
-                })
+                    'conflicting_jobs': availability.conflicting_job_numbers.split(',')
+                }
+                for availability in page
+            ]
         
-        return Response(conflicts)
+        return Response(self.paginated_data(overlapping, serialize))
 
 
-class AppointmentViewSet(viewsets.ModelViewSet):
-    queryset = Appointment.objects.select_related(
-        'technician__user', 'customer', 'customer_property', 'created_by'
-    )
+class AppointmentViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
+    queryset = Appointment.objects.default_qs()
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['technician', 'scheduled_date', 'appointment_type', 'status']
     search_fields = ['title', 'description', 'location_address']
     ordering_fields = ['scheduled_date', 'scheduled_start_time', 'created_at']
     ordering = ['scheduled_date', 'scheduled_start_time']
 
+    list_actions = ['list', 'today', 'upcoming', 'by_technician']
+
+    def get_queryset(self):
+        if self.action in self.list_actions:
+            return Appointment.objects.list_qs()
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return AppointmentCreateUpdateSerializer
@@ -118,75 +160,70 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Get today's appointments"""
-        today_appointments = self.queryset.filter(scheduled_date=date.today())
-        serializer = self.get_serializer(today_appointments, many=True)
-        return Response(serializer.data)
+        def build():
+            today_appointments = self.get_queryset().filter(scheduled_date=date.today())
+            return self.paginated_data(today_appointments)
+        
+        return Response(cached_appointment_data(request, 'today', build))
 
     @action(detail=False, methods=['get'])
     def upcoming(self, request):
         """Get upcoming appointments (next 7 days)"""
-        end_date = date.today() + timedelta(days=7)
-        upcoming_appointments = self.queryset.filter(
-            scheduled_date__gte=date.today(),
-            scheduled_date__lte=end_date,
-            status__in=['scheduled', 'confirmed']
-        )
-        serializer = self.get_serializer(upcoming_appointments, many=True)
-        return Response(serializer.data)
+        def build():
+            end_date = date.today() + timedelta(days=7)
+            upcoming_appointments = self.get_queryset().filter(
+                scheduled_date__gte=date.today(),
+                scheduled_date__lte=end_date,
+                status__in=['scheduled', 'confirmed']
+            )
+            return self.paginated_data(upcoming_appointments)
+        
+        return Response(cached_appointment_data(request, 'upcoming', build))
 
     @action(detail=False, methods=['get'])
     def by_technician(self, request):
         """Get appointments by technician for a date range"""
-        technician_id = request.query_params.get('technician_id')
-        date_from = request.query_params.get('date_from')
-        date_to = request.query_params.get('date_to')
-
-        if not technician_id:
-            return Response({'error': 'technician_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-
-        queryset = self.queryset.filter(technician_id=technician_id)
-
-        if date_from:
-            try:
-                date_from = datetime.strptime(date_from, '%Y-%m-%d').date()
-                queryset = queryset.filter(scheduled_date__gte=date_from)
-            except ValueError:
-                return Response({'error': 'Invalid date_from format. Use YYYY-MM-DD'}, 
-                              status=status.HTTP_400_BAD_REQUEST)
+        params = TechnicianRangeQueryParams(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = _filter_technician_range(self.get_queryset(), params.validated_data, 'scheduled_date')
 
-        if date_to:
-            try:
-                date_to = datetime.strptime(date_to, '%Y-%m-%d').date()
-                queryset = queryset.filter(scheduled_date__lte=date_to)
-            except ValueError:
-                return Response({'error': 'Invalid date_to format. Use YYYY-MM-DD'}, 
-                              status=status.HTTP_400_BAD_REQUEST)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(self.paginated_data(queryset))
 
 
-class ScheduleTemplateViewSet(viewsets.ModelViewSet):
-    queryset = ScheduleTemplate.objects.select_related('technician__user')
-    serializer_class = ScheduleTemplateSerializer
+class ScheduleTemplateViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
+    queryset = ScheduleTemplate.objects.all()
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['technician', 'is_default']
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['technician', 'name']
 
+    list_actions = ['list', 'by_technician']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.list_actions:
+            # List responses don't include the weekly schedule, so skip those columns
+            queryset = queryset.only(
+                'id', 'name', 'description', 'technician', 'technician_display_name',
+                'is_default', 'created_at', 'updated_at'
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in self.list_actions:
+            return ScheduleTemplateListSerializer
+        return ScheduleTemplateSerializer
+
     @action(detail=False, methods=['get'])
     def by_technician(self, request):
         """Get templates for a specific technician"""
-        technician_id = request.query_params.get('technician_id')
-        
-        if not technician_id:
-            return Response({'error': 'technician_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        templates = self.queryset.filter(technician_id=technician_id)
-        serializer = self.get_serializer(templates, many=True)
-        return Response(serializer.data)
+        params = TechnicianRangeQueryParams(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        templates = self.get_queryset().filter(technician_id=params.validated_data['technician_id'])
+        return Response(self.paginated_data(templates))
 
     @action(detail=True, methods=['post'])
     def apply_to_date_range(self, request, pk=None):
@@ -200,8 +237,8 @@ class ScheduleTemplateViewSet(viewsets.ModelViewSet):
                           status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+            start_date = date.fromisoformat(start_date)
+            end_date = date.fromisoformat(end_date)
         except ValueError:
             return Response({'error': 'Invalid date format. Use YYYY-MM-DD'}, 
                           status=status.HTTP_400_BAD_REQUEST)
@@ -210,34 +247,37 @@ class ScheduleTemplateViewSet(viewsets.ModelViewSet):
             return Response({'error': 'end_date must be after start_date'}, 
                           status=status.HTTP_400_BAD_REQUEST)
         
+        # Load the slots that already exist in one query
+        existing = set(TechnicianAvailability.objects.filter(
+            technician=template.technician,
+            date__range=(start_date, end_date)
+        ).values_list('date', 'start_time'))
+        created_by = request.user if request.user.is_authenticated else None
+        
         # Apply template to each date in range
-        current_date = start_date
+        dates = [date.fromordinal(day) for day in range(start_date.toordinal(), end_date.toordinal() + 1)]
+        notes = f'Applied from template: {template.name}'
         created_availability = []
         
-        while current_date <= end_date:
+        for current_date in dates:
             start_time, end_time = template.get_schedule_for_date(current_date)
             
-            if start_time and end_time:
-                # Check if availability already exists
-                existing = TechnicianAvailability.objects.filter(
+            if start_time and end_time and (current_date, start_time) not in existing:
+                # bulk_create skips save(), so carry the denormalized name over from the template
+                created_availability.append(TechnicianAvailability(
                     technician=template.technician,
+                    technician_display_name=template.technician_display_name,
                     date=current_date,
-                    start_time=start_time
-                ).first()
-                
-                if not existing:
-                    availability = TechnicianAvailability.objects.create(
-                        technician=template.technician,
-                        date=current_date,
-                        start_time=start_time,
-                        end_time=end_time,
-                        availability_type='available',
-                        notes=f'Applied from template: {template.name}',
-                        created_by=request.user if request.user.is_authenticated else None
-                    )
-                    created_availability.append(availability)
-            
-            current_date += timedelta(days=1)
+                    start_time=start_time,
+                    end_time=end_time,
+                    availability_type='available',
+                    notes=notes,
+                    created_by=created_by
+                ))
+        
+        TechnicianAvailability.objects.bulk_create(
+            created_availability, batch_size=500, ignore_conflicts=True
+        )
         
         return Response({
             'message': f'Applied template to {len(created_availability)} dates',
@@ -245,35 +285,47 @@ class ScheduleTemplateViewSet(viewsets.ModelViewSet):
         })
 
 
-class ScheduleConflictViewSet(viewsets.ModelViewSet):
+class ScheduleConflictViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
     queryset = ScheduleConflict.objects.select_related(
-        'job', 'technician__user', 'appointment', 'resolved_by'
-    )
+        'job', 'appointment'
+    ).prefetch_related(technician_name_prefetch())
     serializer_class = ScheduleConflictSerializer
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['conflict_type', 'resolution_status', 'technician', 'conflict_date']
     ordering_fields = ['detected_at', 'conflict_date']
     ordering = ['-detected_at']
 
+    list_actions = ['list', 'unresolved', 'by_technician']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.list_actions:
+            # Only the job and appointment columns the serializer shows
+            queryset = queryset.only(
+                'id', 'conflict_type', 'description', 'resolution_status', 'resolution_notes',
+                'job', 'technician', 'appointment', 'conflict_date', 'conflict_start_time',
+                'conflict_end_time', 'detected_at', 'resolved_at', 'resolved_by',
+                'job__id', 'job__title', 'job__job_number', 'appointment__id', 'appointment__title'
+            )
+        return queryset
+
     @action(detail=False, methods=['get'])
     def unresolved(self, request):
         """Get unresolved conflicts"""
-        unresolved = self.queryset.filter(resolution_status='unresolved')
-        serializer = self.get_serializer(unresolved, many=True)
-        return Response(serializer.data)
+        unresolved = self.get_queryset().filter(resolution_status='unresolved')
+        return Response(self.paginated_data(unresolved))
 
     @action(detail=False, methods=['get'])
     def by_technician(self, request):
         """Get conflicts for a specific technician"""
-        technician_id = request.query_params.get('technician_id')
-        
-        if not technician_id:
-            return Response({'error': 'technician_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        conflicts = self.queryset.filter(technician_id=technician_id)
-        serializer = self.get_serializer(conflicts, many=True)
-        return Response(serializer.data)
+        params = TechnicianRangeQueryParams(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        conflicts = _filter_technician_range(
+            self.get_queryset(), params.validated_data, 'conflict_date'
+        )
+        return Response(self.paginated_data(conflicts))
 
     @action(detail=True, methods=['post'])
     def resolve(self, request, pk=None):
@@ -299,7 +351,7 @@ class ScheduleConflictViewSet(viewsets.ModelViewSet):
             start_date = date.today()
         else:
             try:
-                start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                start_date = date.fromisoformat(start_date)
             except ValueError:
                 return Response({'error': 'Invalid start_date format. Use YYYY-MM-DD'}, 
                               status=status.HTTP_400_BAD_REQUEST)
@@ -308,50 +360,15 @@ class ScheduleConflictViewSet(viewsets.ModelViewSet):
             end_date = start_date + timedelta(days=7)
         else:
             try:
-                end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+                end_date = date.fromisoformat(end_date)
             except ValueError:
                 return Response({'error': 'Invalid end_date format. Use YYYY-MM-DD'}, 
                               status=status.HTTP_400_BAD_REQUEST)
         
-        # Detect conflicts and create conflict records
-        conflicts_created = 0
-        
-        # Get all jobs in date range
-        jobs = Job.objects.filter(
-            scheduled_date__gte=start_date,
-            scheduled_date__lte=end_date,
-            assigned_technician__isnull=False
-        )
-        
-        for job in jobs:
-            # Check for overlapping jobs
-            overlapping_jobs = Job.objects.filter(
-                assigned_technician=job.assigned_technician,
-                scheduled_date=job.scheduled_date,
-                scheduled_start_time__lt=job.scheduled_end_time,
-                scheduled_end_time__gt=job.scheduled_start_time
-            ).exclude(pk=job.pk)
-            
-            for overlapping_job in overlapping_jobs:
-                # Check if conflict already exists
-                existing_conflict = ScheduleConflict.objects.filter(
-                    job=job,
-                    technician=job.assigned_technician,
-                    conflict_type='job_overlap',
-                    conflict_date=job.scheduled_date
-                ).first()
-                
-                if not existing_conflict:
-                    ScheduleConflict.objects.create(
-                        conflict_type='job_overlap',
-                        description=f'Job {job.job_number} overlaps with job {overlapping_job.job_number}',
-                        job=job,
-                        technician=job.assigned_technician,
-                        conflict_date=job.scheduled_date,
-                        conflict_start_time=job.scheduled_start_time,
-                        conflict_end_time=job.scheduled_end_time
-                    )
-                    conflicts_created += 1
+        # One UNION query for the whole range, swept per technician-day in Python
+        new_conflicts = detect_range_conflicts(start_date, end_date)
+        ScheduleConflict.objects.bulk_create(new_conflicts, batch_size=500, ignore_conflicts=True)
+        conflicts_created = len(new_conflicts)
         
         return Response({
             'message': f'Conflict detection completed',
@@ -361,9 +378,10 @@ class ScheduleConflictViewSet(viewsets.ModelViewSet):
 
 
 class ScheduleOptimizationViewSet(viewsets.ModelViewSet):
-    queryset = ScheduleOptimization.objects.select_related('technician__user', 'created_by')
+    queryset = ScheduleOptimization.objects.select_related('created_by')
     serializer_class = ScheduleOptimizationSerializer
     permission_classes = [AllowAny]
+    metadata_class = CachedSimpleMetadata
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['technician', 'target_date', 'optimization_type']
     ordering_fields = ['optimization_date', 'target_date', 'optimization_score']
@@ -376,85 +394,71 @@ class ScheduleOptimizationViewSet(viewsets.ModelViewSet):
         
         if target_date:
             try:
-                target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+                target_date = date.fromisoformat(target_date)
             except ValueError:
                 return Response({'error': 'Invalid date format. Use YYYY-MM-DD'}, 
                               status=status.HTTP_400_BAD_REQUEST)
         else:
             target_date = date.today()
         
-        # Get all technicians with jobs or appointments on target date
+        day_jobs = Job.objects.filter(scheduled_date=target_date)
+        day_appointments = Appointment.objects.filter(scheduled_date=target_date)
+        day_conflicts = ScheduleConflict.objects.filter(
+            conflict_date=target_date,
+            resolution_status='unresolved'
+        )
+        
+        # Get all technicians with jobs or appointments on target date, with their totals
         technicians = Technician.objects.filter(
-            Q(assigned_jobs__scheduled_date=target_date) |
-            Q(appointments__scheduled_date=target_date)
-        ).distinct()
+            Q(pk__in=day_jobs.values('assigned_technician')) |
+            Q(pk__in=day_appointments.values('technician'))
+        ).annotate(
+            full_name=Trim(Concat('user__first_name', Value(' '), 'user__last_name')),
+            total_jobs=_count_subquery(day_jobs, 'assigned_technician'),
+            total_appointments=_count_subquery(day_appointments, 'technician'),
+            conflicts_count=_count_subquery(day_conflicts, 'technician'),
+            job_seconds=_seconds_subquery(
+                day_jobs, 'assigned_technician', 'scheduled_start_time', 'scheduled_end_time'
+            ),
+            appointment_seconds=_seconds_subquery(
+                day_appointments, 'technician', 'scheduled_start_time', 'scheduled_end_time'
+            )
+        ).annotate(
+            # Same value on every row: the day's mean work seconds across these technicians
+            average_work_seconds=Window(
+                Avg(F('job_seconds') + F('appointment_seconds'), output_field=FloatField())
+            )
+        ).values(
+            *OVERVIEW_TECHNICIAN_FIELDS, 'total_jobs', 'total_appointments', 'conflicts_count',
+            'job_seconds', 'appointment_seconds', 'average_work_seconds'
+        )
         
+        # Plain dict rows: no model instances are built for the overview
         technician_schedules = []
         total_jobs = 0
+        average_work_seconds = 0
         
-        for technician in technicians:
-            # Get jobs for the date
-            jobs = Job.objects.filter(
-                assigned_technician=technician,
-                scheduled_date=target_date
-            )
-            
-            # Get appointments for the date
-            appointments = Appointment.objects.filter(
-                technician=technician,
-                scheduled_date=target_date
-            )
-            
-            # Calculate metrics
-            job_count = jobs.count()
-            appointment_count = appointments.count()
-            total_jobs += job_count
-            
-            # Calculate work hours (simplified)
-            total_work_hours = 0
-            for job in jobs:
-                if job.scheduled_start_time and job.scheduled_end_time:
-                    start_dt = datetime.combine(target_date, job.scheduled_start_time)
-                    end_dt = datetime.combine(target_date, job.scheduled_end_time)
-                    duration = end_dt - start_dt
-                    total_work_hours += duration.total_seconds() / 3600
-            
-            for appointment in appointments:
-                duration = appointment.duration
-                total_work_hours += duration.total_seconds() / 3600
-            
-            # Get conflicts
-            conflicts = ScheduleConflict.objects.filter(
-                technician=technician,
-                conflict_date=target_date,
-                resolution_status='unresolved'
-            ).count()
+        for row in technicians:
+            total_jobs += row['total_jobs']
+            average_work_seconds = row['average_work_seconds']
+            total_work_hours = (row['job_seconds'] + row['appointment_seconds']) / 3600
             
             technician_schedules.append({
-                'technician': {
-                    'id': technician.id,
-                    'full_name': technician.user.get_full_name(),
-                    'employee_id': technician.employee_id
-                },
+                'technician': {field: row[field] for field in OVERVIEW_TECHNICIAN_FIELDS},
                 'date': target_date,
-                'total_jobs': job_count,
-                'total_appointments': appointment_count,
+                'total_jobs': row['total_jobs'],
+                'total_appointments': row['total_appointments'],
                 'total_work_hours': round(total_work_hours, 2),
                 'total_travel_time': 0,  # TODO: Calculate from route optimization
                 'total_travel_distance': 0,  # TODO: Calculate from route optimization
                 'utilization_percentage': round((total_work_hours / 8) * 100, 2) if total_work_hours > 0 else 0,
-                'conflicts_count': conflicts
+                'conflicts_count': row['conflicts_count']
             })
         
         # Calculate summary metrics
-        avg_utilization = 0
-        if technician_schedules:
-            avg_utilization = sum(t['utilization_percentage'] for t in technician_schedules) / len(technician_schedules)
+        avg_utilization = (average_work_seconds / 3600 / 8) * 100
         
-        unresolved_conflicts = ScheduleConflict.objects.filter(
-            conflict_date=target_date,
-            resolution_status='unresolved'
-        ).count()
+        unresolved_conflicts = day_conflicts.count()
         
         response_data = {
             'date': target_date,
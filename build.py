@@ -5,25 +5,46 @@ This script handles the Python-specific build steps
 """
 
 import os
+import shlex
 import subprocess
 import sys
 
-def run_command(command, description):
-    """Run a shell command and handle errors"""
+def run_command(args, description):
+    """Run a command (argv list), streaming its output, and exit on failure"""
     print(f"Running: {description}")
-    print(f"Command: {command}")
-    
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print(f"Error during {description}:")
-        print(f"STDOUT: {result.stdout}")
-        print(f"STDERR: {result.stderr}")
-        sys.exit(1)
-    else:
-        print(f"✓ {description} completed successfully")
-        if result.stdout:
-            print(f"Output: {result.stdout}")
+    print(f"Command: {shlex.join(args)}")
+    
+    try:
+        subprocess.run(args, check=True)
+    except (subprocess.CalledProcessError, OSError) as exc:
+        print(f"Error during {description}: {exc}")
+        sys.exit(getattr(exc, 'returncode', 1) or 1)
+    
+    print(f"✓ {description} completed successfully")
+
+def run_commands_parallel(steps):
+    """
+    Run independent (args, description) steps at the same time.
+    Any step that fails is retried on its own so a clash between them can't fail the build.
+    """
+    processes = []
+    for args, description in steps:
+        print(f"Running: {description}")
+        print(f"Command: {shlex.join(args)}")
+        processes.append((args, description, subprocess.Popen(args)))
+    
+    failed = []
+    for args, description, process in processes:
+        if process.wait() == 0:
+            print(f"✓ {description} completed successfully")
+        else:
+            print(f"Error during {description} (exit code {process.returncode})")
+            failed.append((args, description))
+    
+    # Everything has exited by now, so retries run alone
+    for args, description in failed:
+        print(f"Retrying sequentially: {description}")
+        run_command(args, description)
 
 def main():
     """Main build process"""
@@ -35,13 +56,13 @@ def main():
     print(f"Changed to directory: {os.getcwd()}")
     
     # Install Python dependencies
-    run_command("pip install -r requirements.txt", "Installing Python dependencies")
-    
-    # Run Django migrations
-    run_command("python manage.py migrate", "Running Django migrations")
+    run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], "Installing Python dependencies")
     
-    # Collect static files
-    run_command("python manage.py collectstatic --noinput", "Collecting static files")
+    # Migrations and static collection don't depend on each other, so run them together
+    run_commands_parallel([
+        ([sys.executable, "manage.py", "migrate"], "Running Django migrations"),
+        ([sys.executable, "manage.py", "collectstatic", "--noinput"], "Collecting static files"),
+    ])
     
     print("🎉 Build process completed successfully!")
 